@@ -1,9 +1,14 @@
 import asyncio
-import json
-from datetime import timedelta
-from typing import Any, Dict, List, Optional, Union
+import functools
+import random
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, List, NoReturn, Optional, Tuple, Union
+from urllib.parse import urlencode
 
-import requests
+import httpx
+import orjson
 
 from .models import (
     Adsorbates,
@@ -17,8 +22,78 @@ from .models import (
     Models,
     Slab,
     Slabs,
+    _DataModel,
 )
 
+# Headers sent with all requests. Responses, which can include large arrays
+# of positions and forces, are requested in compressed form.
+_DEFAULT_HEADERS: Dict[str, str] = {"Accept-Encoding": "zstd, gzip"}
+
+# Headers sent with all requests that include a JSON body
+_JSON_HEADERS: Dict[str, str] = {"Content-Type": "application/json"}
+
+# Options used when serializing request bodies. Dataclasses are passed to
+# _json_default() instead of being serialized natively so that data models
+# are converted with their own field names.
+_ORJSON_OPTIONS: int = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Fallback used by orjson for objects that it does not serialize natively.
+
+    Atoms objects are converted to a dict of their raw field values, without
+    copying, so that numpy arrays (for example positions copied from
+    ase.Atoms objects) are passed to orjson as-is and serialized directly
+    from their underlying buffers. Atoms have no renamed fields, so this
+    matches the output of to_dict(). All other data models are converted
+    with their own to_dict() method so that field renames and catch-all
+    fields are honored; any Atoms nested inside them are converted to lists
+    by that method.
+
+    Args:
+        obj: The object to convert.
+
+    Raises:
+        TypeError: If the object cannot be converted.
+
+    Returns:
+        A value that orjson is able to serialize.
+    """
+    if isinstance(obj, Atoms):
+        return {
+            **{
+                f.name: getattr(obj, f.name)
+                for f in fields(obj)
+                if f.name != "other_fields"
+            },
+            **(obj.other_fields or {}),
+        }
+    if isinstance(obj, _DataModel):
+        return obj.to_dict()
+
+    # orjson falls back to this method for numpy arrays that it cannot read
+    # directly, e.g. those that are not C-contiguous or that have an
+    # unsupported dtype
+    if callable(tolist := getattr(obj, "tolist", None)):
+        return tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serializes the input object to a UTF-8 encoded JSON document. Data models
+    are serialized directly rather than needing to be converted to dicts by
+    the caller. See _json_default() for details about how each is converted.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        The JSON-encoded object.
+    """
+    return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS)
+
 
 class RequestException(Exception):
     """
@@ -79,24 +154,296 @@ class RateLimitExceededException(RequestException):
         self.retry_after: Optional[timedelta] = retry_after
 
 
+@dataclass
+class _LoopState:
+    """
+    Objects used by a Client that are bound to the event loop on which they
+    were created.
+    """
+
+    loop: asyncio.AbstractEventLoop
+    """
+    The event loop on which all other objects were created.
+    """
+
+    http_client: httpx.AsyncClient
+    """
+    The HTTP client that owns the pool of connections to the API.
+    """
+
+    request_semaphore: Optional[asyncio.Semaphore]
+    """
+    If not None, limits the number of requests that are in flight at once.
+    """
+
+    bulks_lock: asyncio.Lock
+    """
+    Held while the list of supported bulks is being fetched.
+    """
+
+    adsorbates_lock: asyncio.Lock
+    """
+    Held while the list of supported adsorbates is being fetched.
+    """
+
+    inflight_requests: Dict[Tuple[str, str], "asyncio.Task[bytes]"] = field(
+        default_factory=dict
+    )
+    """
+    GET requests that are currently running, keyed by method and URL.
+    Concurrent calls for the same URL wait on the same task instead of each
+    making a request.
+    """
+
+
+@functools.lru_cache(maxsize=64)
+def _retry_after_seconds(value: str) -> timedelta:
+    """
+    Converts a retry-after value in seconds to a timedelta. Results are
+    cached since many concurrent requests that are rate limited at the same
+    time tend to receive the same value.
+
+    Args:
+        value: The number of seconds to wait.
+
+    Raises:
+        ValueError: If the input is not a number.
+        OverflowError: If the input is too large (including infinity) to be
+            represented as a timedelta.
+
+    Returns:
+        The time to wait.
+    """
+    return timedelta(seconds=float(value))
+
+
+def _parse_retry_after(value: str) -> Optional[timedelta]:
+    """
+    Parses the value of a Retry-After header, which can either be a number
+    of seconds or an HTTP date (RFC 9110, section 10.2.3).
+
+    Args:
+        value: The value of the header.
+
+    Returns:
+        The time to wait before retrying, or None if the value could not be
+        parsed.
+    """
+    try:
+        return _retry_after_seconds(value)
+    except (ValueError, OverflowError):
+        pass
+
+    # Fall back to parsing the value as a date. Dates in the past mean that
+    # a retry can be made immediately.
+    try:
+        retry_at: datetime = parsedate_to_datetime(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(retry_at - datetime.now(timezone.utc), timedelta(0))
+
+
+def _raise_rate_limit_exceeded(
+    response: httpx.Response, method: str, url: str
+) -> NoReturn:
+    """
+    Handles a response indicating that a server side rate limit was exceeded.
+
+    Args:
+        response: The response that was received.
+        method: The HTTP method that was used (GET, POST, etc.).
+        url: The full URL that was called.
+
+    Raises:
+        RateLimitExceededException: Always.
+    """
+    raise RateLimitExceededException(
+        method=method,
+        url=url,
+        retry_after=_parse_retry_after(h)
+        if (h := response.headers.get("Retry-After")) is not None
+        else None,
+    )
+
+
+# Handlers for response codes that need to be treated differently than
+# others in the same class (4xx, 5xx, etc.)
+_STATUS_HANDLERS: Dict[int, Callable[[httpx.Response, str, str], NoReturn]] = {
+    429: _raise_rate_limit_exceeded,
+}
+
+
+def _raise_for_status(response: httpx.Response, method: str, url: str) -> NoReturn:
+    """
+    Raises the exception that corresponds to an unsuccessful response.
+
+    Args:
+        response: The unsuccessful response that was received.
+        method: The HTTP method that was used (GET, POST, etc.).
+        url: The full URL that was called.
+
+    Raises:
+        RateLimitExceededException: If the call was rejected because a
+            server side rate limit was breached.
+        NonRetryableRequestException: If the call was rejected and a retry
+            is not expected to succeed.
+        RequestException: For all other response codes; it is possible,
+            though not guaranteed, that a retry could succeed.
+    """
+    if (handler := _STATUS_HANDLERS.get(response.status_code)) is not None:
+        handler(response, method, url)
+
+    # Treat all other 400-level response codes as ones that are unlikely to
+    # succeed on retry
+    cause: str = (
+        f"Unexpected response code: {response.status_code}. "
+        f"Response body: {response.text}"
+    )
+    if 400 <= response.status_code < 500:
+        raise NonRetryableRequestException(
+            method=method,
+            url=url,
+            cause=cause,
+        )
+
+    # Treat all other errors as ones that might succeed on retry
+    raise RequestException(
+        method=method,
+        url=url,
+        cause=cause,
+    )
+
+
+async def _close_stale_http_client(http_client: httpx.AsyncClient) -> None:
+    """
+    Closes an HTTP client that was created on an event loop that has since
+    been closed. The client's connections are removed from its pool and the
+    client is marked as closed, but their sockets cannot be shut down
+    cleanly since that requires the closed loop; they are released when
+    garbage collected.
+
+    Args:
+        http_client: The client to close.
+    """
+    try:
+        await http_client.aclose()
+    except RuntimeError:
+        # Raised when a connection tries to schedule its shutdown on the
+        # closed event loop
+        pass
+
+
 class Client:
     """
     Exposes each route in the OCP API as a method.
+
+    A single connection pool is shared by all calls made through an instance
+    of this class so that connections to the API can be reused. Instances can
+    be used as async context managers, or aclose() can be called directly, in
+    order to release those connections.
+
+    Connection pools are bound to the event loop on which they were opened.
+    If an instance is used on a new event loop (e.g. in a later call to
+    asyncio.run()), a new pool is created and the pool from the previous loop
+    is released once that loop has been closed. Connections in a released
+    pool cannot be shut down cleanly, so their sockets remain open until they
+    are garbage collected; call aclose() before the event loop exits to avoid
+    this.
+
+    The lists of bulks and adsorbates that are supported in the API are
+    cached after they are first fetched. Call invalidate_cache() to force
+    them to be fetched again.
     """
 
     def __init__(
         self,
         host: str = "open-catalyst-api.metademolab.com",
         scheme: str = "https",
+        timeout_sec: float = 30,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        max_concurrent_requests: Optional[int] = None,
+        max_rate_limit_retries: int = 0,
+        rate_limit_backoff_base_sec: float = 1,
+        rate_limit_backoff_max_sec: float = 60,
+        rate_limit_max_jitter_sec: float = 1,
     ) -> None:
         """
         Args:
             host: The host that will be called.
             scheme: The scheme used when making API calls.
+            timeout_sec: The number of seconds to wait for each request to
+                complete.
+            max_connections: The maximum number of concurrent connections
+                that will be opened to the API.
+            max_keepalive_connections: The maximum number of idle connections
+                that will be kept open for reuse.
+            max_concurrent_requests: If not None, the maximum number of
+                requests that will be in flight at once across all calls
+                made with this client. Additional calls wait for a running
+                request to finish before they are sent.
+            max_rate_limit_retries: The number of times a request that was
+                rejected because of a rate limit will be retried before a
+                RateLimitExceededException is raised. By default requests are
+                not retried.
+            rate_limit_backoff_base_sec: When a rate-limited response does not
+                include a retry-after value, the number of seconds to wait
+                before the first retry. The wait doubles after each attempt.
+            rate_limit_backoff_max_sec: The maximum number of seconds to wait
+                between retries. If the API returns a retry-after value that
+                is larger than this, the request is not retried and the
+                RateLimitExceededException is raised immediately so that the
+                caller can decide how to handle the long wait.
+            rate_limit_max_jitter_sec: The maximum number of seconds that will
+                be randomly added to the wait before each retry.
+
+        Raises:
+            ValueError: If max_concurrent_requests is less than 1.
         """
+        if max_concurrent_requests is not None and max_concurrent_requests < 1:
+            raise ValueError(
+                "max_concurrent_requests must be None or at least 1, "
+                f"got {max_concurrent_requests}"
+            )
+
         self._host = host
         self._base_url = f"{scheme}://{host}"
 
+        # Full URLs of each route, built once rather than on every call
+        self._url_models = f"{self._base_url}/ocp/models"
+        self._url_bulks = f"{self._base_url}/ocp/bulks"
+        self._url_adsorbates = f"{self._base_url}/ocp/adsorbates"
+        self._url_slabs = f"{self._base_url}/ocp/slabs"
+        self._url_adsorbate_slab_configs = (
+            f"{self._base_url}/ocp/adsorbate-slab-configs"
+        )
+        self._url_adsorbate_slab_relaxations = (
+            f"{self._base_url}/ocp/adsorbate-slab-relaxations"
+        )
+        self._timeout = httpx.Timeout(timeout_sec)
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._max_concurrent_requests = max_concurrent_requests
+        self._max_rate_limit_retries = max_rate_limit_retries
+        self._rate_limit_backoff_base_sec = rate_limit_backoff_base_sec
+        self._rate_limit_backoff_max_sec = rate_limit_backoff_max_sec
+        self._rate_limit_max_jitter_sec = rate_limit_max_jitter_sec
+
+        # The underlying HTTP client is created lazily since pooled
+        # connections are bound to the event loop on which they were opened.
+        # A new client is created if this instance is later used on a
+        # different event loop (e.g. across multiple calls to asyncio.run()).
+        # The same applies to locks and semaphores used by this class.
+        self._loop_state: Optional[_LoopState] = None
+
+        # Responses from routes that return the same data on every call
+        self._bulks_cache: Optional[Bulks] = None
+        self._adsorbates_cache: Optional[Adsorbates] = None
+
     @property
     def host(self) -> str:
         """
@@ -104,6 +451,35 @@ class Client:
         """
         return self._host
 
+    async def __aenter__(self) -> "Client":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Closes any open connections to the API. The client can still be used
+        after calling this method; new connections will be opened as needed.
+        """
+        loop_state: Optional[_LoopState] = self._loop_state
+        self._loop_state = None
+        if loop_state is not None:
+            # Connections opened on an event loop that has since been closed
+            # cannot be shut down cleanly
+            if loop_state.loop.is_closed():
+                await _close_stale_http_client(loop_state.http_client)
+            else:
+                await loop_state.http_client.aclose()
+
+    def invalidate_cache(self) -> None:
+        """
+        Clears cached responses so that the next call to each route fetches
+        fresh data from the API.
+        """
+        self._bulks_cache = None
+        self._adsorbates_cache = None
+
     async def get_models(self) -> Models:
         """
         Fetch the list of models that are supported in the API.
@@ -119,15 +495,16 @@ class Client:
         Returns:
             The models that are supported in the API.
         """
-        response: str = await self._run_request(
-            path="ocp/models",
+        response: bytes = await self._run_request(
+            url=self._url_models,
             method="GET",
         )
-        return Models.from_json(response)
+        return Models.from_bytes(response)
 
     async def get_bulks(self) -> Bulks:
         """
-        Fetch the list of bulk materials that are supported in the API.
+        Fetch the list of bulk materials that are supported in the API. The
+        result is cached after the first successful call.
 
         Raises:
             RateLimitExceededException: If the call was rejected because a
@@ -140,15 +517,22 @@ class Client:
         Returns:
             The bulks that are supported throughout the API.
         """
-        response: str = await self._run_request(
-            path="ocp/bulks",
-            method="GET",
-        )
-        return Bulks.from_json(response)
+        # Concurrent calls wait for a single request to finish instead of
+        # each fetching the same list
+        if self._bulks_cache is None:
+            async with (await self._get_loop_state()).bulks_lock:
+                if self._bulks_cache is None:
+                    response: bytes = await self._run_request(
+                        url=self._url_bulks,
+                        method="GET",
+                    )
+                    self._bulks_cache = Bulks.from_bytes(response)
+        return self._bulks_cache
 
     async def get_adsorbates(self) -> Adsorbates:
         """
-        Fetch the list of adsorbates that are supported in the API.
+        Fetch the list of adsorbates that are supported in the API. The
+        result is cached after the first successful call.
 
         Raises:
             RateLimitExceededException: If the call was rejected because a
@@ -161,11 +545,17 @@ class Client:
         Returns:
             The adsorbates that are supported throughout the API.
         """
-        response: str = await self._run_request(
-            path="ocp/adsorbates",
-            method="GET",
-        )
-        return Adsorbates.from_json(response)
+        # Concurrent calls wait for a single request to finish instead of
+        # each fetching the same list
+        if self._adsorbates_cache is None:
+            async with (await self._get_loop_state()).adsorbates_lock:
+                if self._adsorbates_cache is None:
+                    response: bytes = await self._run_request(
+                        url=self._url_adsorbates,
+                        method="GET",
+                    )
+                    self._adsorbates_cache = Adsorbates.from_bytes(response)
+        return self._adsorbates_cache
 
     async def get_slabs(self, bulk: Union[str, Bulk]) -> Slabs:
         """
@@ -186,15 +576,15 @@ class Client:
         Returns:
             Slabs for each of the unique surfaces of the material.
         """
-        response: str = await self._run_request(
-            path="ocp/slabs",
+        response: bytes = await self._run_request(
+            url=self._url_slabs,
             method="POST",
-            data=json.dumps(
+            content=_dumps(
                 {"bulk_src_id": bulk.src_id if isinstance(bulk, Bulk) else bulk}
             ),
-            headers={"Content-Type": "application/json"},
+            headers=_JSON_HEADERS,
         )
-        return Slabs.from_json(response)
+        return Slabs.from_bytes(response)
 
     async def get_adsorbate_slab_configs(
         self, adsorbate: str, slab: Slab
@@ -219,18 +609,61 @@ class Client:
         Returns:
             Configurations for each adsorbate binding site on the slab.
         """
-        response: str = await self._run_request(
-            path="ocp/adsorbate-slab-configs",
+        response: bytes = await self._run_request(
+            url=self._url_adsorbate_slab_configs,
             method="POST",
-            data=json.dumps(
+            content=_dumps(
                 {
                     "adsorbate": adsorbate,
-                    "slab": slab.to_dict(),
+                    "slab": slab,
                 }
             ),
-            headers={"Content-Type": "application/json"},
+            headers=_JSON_HEADERS,
         )
-        return AdsorbateSlabConfigs.from_json(response)
+        return AdsorbateSlabConfigs.from_bytes(response)
+
+    async def get_adsorbate_slab_configs_many(
+        self,
+        adsorbate: str,
+        slabs: List[Slab],
+        *,
+        concurrency: int = 8,
+    ) -> List[AdsorbateSlabConfigs]:
+        """
+        Get a list of possible binding sites for the input adsorbate on each
+        of the input slabs. Requests for different slabs are run concurrently.
+
+        Args:
+            adsorbate: Description of the the adsorbate to place.
+            slabs: Information about the slabs on which the adsorbate should
+                be placed.
+            concurrency: The maximum number of requests that will be in
+                flight at once.
+
+        Raises:
+            RateLimitExceededException: If any call was rejected because a
+                server side rate limit was breached.
+            NonRetryableRequestException: If any call was rejected and a retry
+                is not expected to succeed.
+            RequestException: For all other errors when making the requests;
+                it is possible, though not guaranteed, that a retry could
+                succeed.
+            ValueError: If concurrency is less than 1.
+
+        Returns:
+            Configurations for each adsorbate binding site on each slab, in
+            the same order as the input slabs.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get_configs(slab: Slab) -> AdsorbateSlabConfigs:
+            async with semaphore:
+                return await self.get_adsorbate_slab_configs(adsorbate, slab)
+
+        return list(await asyncio.gather(*[get_configs(s) for s in slabs]))
 
     async def submit_adsorbate_slab_relaxations(
         self,
@@ -272,22 +705,22 @@ class Client:
         Returns:
             IDs of the relaxations.
         """
-        response: str = await self._run_request(
-            path="ocp/adsorbate-slab-relaxations",
+        response: bytes = await self._run_request(
+            url=self._url_adsorbate_slab_relaxations,
             method="POST",
-            data=json.dumps(
+            content=_dumps(
                 {
                     "adsorbate": adsorbate,
-                    "adsorbate_configs": [a.to_dict() for a in adsorbate_configs],
-                    "bulk": bulk.to_dict(),
-                    "slab": slab.to_dict(),
+                    "adsorbate_configs": adsorbate_configs,
+                    "bulk": bulk,
+                    "slab": slab,
                     "model": model,
                     "ephemeral": ephemeral,
                 }
             ),
-            headers={"Content-Type": "application/json"},
+            headers=_JSON_HEADERS,
         )
-        return AdsorbateSlabRelaxationsSystem.from_json(response)
+        return AdsorbateSlabRelaxationsSystem.from_bytes(response)
 
     async def get_adsorbate_slab_relaxations_request(
         self, system_id: str
@@ -309,11 +742,11 @@ class Client:
         Returns:
             The original request that was made when submitting relaxations.
         """
-        response: str = await self._run_request(
-            path=f"ocp/adsorbate-slab-relaxations/{system_id}",
+        response: bytes = await self._run_request(
+            url=self._url_adsorbate_slab_relaxations + "/" + system_id,
             method="GET",
         )
-        return AdsorbateSlabRelaxationsRequest.from_json(response)
+        return AdsorbateSlabRelaxationsRequest.from_bytes(response)
 
     async def get_adsorbate_slab_relaxations_results(
         self,
@@ -342,17 +775,20 @@ class Client:
         Returns:
             The relaxation results for each configuration in the system.
         """
-        params: Dict[str, Any] = {}
-        if fields:
-            params["field"] = fields
-        if config_ids:
-            params["config_id"] = config_ids
-        response: str = await self._run_request(
-            path=f"ocp/adsorbate-slab-relaxations/{system_id}/configs",
+        # Build the query string in a single pass since the list of config
+        # ids can be long
+        url: str = self._url_adsorbate_slab_relaxations + "/" + system_id + "/configs"
+        query: str = urlencode(
+            [("field", f) for f in fields or []]
+            + [("config_id", c) for c in config_ids or []]
+        )
+        if query:
+            url = url + "?" + query
+        response: bytes = await self._run_request(
+            url=url,
             method="GET",
-            params=params,
         )
-        return AdsorbateSlabRelaxationsResults.from_json(response)
+        return AdsorbateSlabRelaxationsResults.from_bytes(response)
 
     async def delete_adsorbate_slab_relaxations(self, system_id: str) -> None:
         """
@@ -370,78 +806,209 @@ class Client:
                 is possible, though not guaranteed, that a retry could succeed.
         """
         await self._run_request(
-            path=f"ocp/adsorbate-slab-relaxations/{system_id}",
+            url=self._url_adsorbate_slab_relaxations + "/" + system_id,
             method="DELETE",
         )
 
-    async def _run_request(self, path: str, method: str, **kwargs) -> str:
+    async def _get_loop_state(self) -> _LoopState:
         """
-        Helper method that runs the input request on a thread so that
-        it doesn't block the event loop on the calling thread.
+        Returns the HTTP client, locks, etc. to use on the currently-running
+        event loop, creating new ones if needed. If the objects being replaced
+        were created on an event loop that has since been closed, their
+        connection pool is released.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._loop_state is None or self._loop_state.loop is not loop:
+            stale: Optional[_LoopState] = self._loop_state
+            self._loop_state = _LoopState(
+                loop=loop,
+                http_client=httpx.AsyncClient(
+                    base_url=self._base_url,
+                    limits=self._limits,
+                    timeout=self._timeout,
+                    headers=_DEFAULT_HEADERS,
+                    follow_redirects=True,
+                    http2=True,
+                ),
+                request_semaphore=asyncio.Semaphore(self._max_concurrent_requests)
+                if self._max_concurrent_requests is not None
+                else None,
+                bulks_lock=asyncio.Lock(),
+                adsorbates_lock=asyncio.Lock(),
+            )
+
+            # Only clean up after loops that are closed; if the old loop is
+            # still running (e.g. on another thread), its requests may still
+            # be using the old client
+            if stale is not None and stale.loop.is_closed():
+                await _close_stale_http_client(stale.http_client)
+        return self._loop_state
+
+    def _get_rate_limit_wait_sec(
+        self,
+        exception: RateLimitExceededException,
+        attempt: int,
+    ) -> Optional[float]:
+        """
+        Returns the number of seconds to wait before retrying a request that
+        was rate limited. The retry-after value from the API is used if it is
+        known, otherwise an exponential backoff is applied. In both cases a
+        random jitter is added so that concurrent callers do not all retry at
+        the same moment.
 
         Args:
-            path: The URL path to make the request against.
+            exception: The exception that was raised by the failed request.
+            attempt: The zero-based index of the attempt that failed.
+
+        Returns:
+            The number of seconds to wait, or None if the retry-after value
+            from the API exceeds the maximum wait and the request should not
+            be retried.
+        """
+        if exception.retry_after is not None:
+            wait_for: float = exception.retry_after.total_seconds()
+            if wait_for > self._rate_limit_backoff_max_sec:
+                return None
+        else:
+            wait_for = min(
+                self._rate_limit_backoff_base_sec * 2**attempt,
+                self._rate_limit_backoff_max_sec,
+            )
+        return wait_for + random.uniform(0, self._rate_limit_max_jitter_sec)
+
+    async def _run_request(self, url: str, method: str, **kwargs) -> bytes:
+        """
+        Helper method that runs the input request. If an identical GET
+        request is already running, its result is shared instead of making
+        another call to the API.
+
+        Args:
+            url: The full URL to make the request against.
             method: The HTTP method to use (GET, POST, etc.).
 
         Raises:
             RateLimitExceededException: If the call was rejected because a
-                server side rate limit was breached.
+                server side rate limit was breached and retries have been
+                exhausted.
             NonRetryableRequestException: If the call was rejected and a retry
                 is not expected to succeed.
             RequestException: For all other errors when making the request; it
                 is possible, though not guaranteed, that a retry could succeed.
 
         Returns:
-            The response body from the request as a string.
+            The raw response body from the request.
         """
 
-        # Make the request
-        url = f"{self._base_url}/{path}"
-        try:
-            response: requests.Response = await asyncio.to_thread(
-                requests.request,
-                method=method,
-                url=url,
-                **kwargs,
-            )
-        except Exception as e:
-            raise RequestException(
-                method=method,
-                url=url,
-                cause=f"Exception while making request: {type(e).__name__}: {e}",
-            ) from e
+        # Only GET requests, which do not change state on the server, are
+        # safe to share between callers
+        if method != "GET" or kwargs:
+            return await self._run_request_with_retries(url, method, **kwargs)
+
+        inflight: Dict[Tuple[str, str], asyncio.Task[bytes]] = (
+            await self._get_loop_state()
+        ).inflight_requests
+        key: Tuple[str, str] = (method, url)
+        if (task := inflight.get(key)) is None:
+            task = asyncio.ensure_future(self._run_request_with_retries(url, method))
+            inflight[key] = task
+
+            def on_done(t: asyncio.Task[bytes]) -> None:
+                inflight.pop(key, None)
+                # Mark any exception as retrieved in case every caller was
+                # cancelled before the request finished
+                if not t.cancelled():
+                    t.exception()
+
+            task.add_done_callback(on_done)
+
+        # Shield the shared task so that cancelling one caller does not
+        # cancel the request for all others
+        return await asyncio.shield(task)
+
+    async def _run_request_with_retries(self, url: str, method: str, **kwargs) -> bytes:
+        """
+        Helper method that runs the input request, retrying it if it is
+        rejected because of a rate limit and this client was configured to
+        do so.
 
-        # Check the response code
-        if response.status_code >= 300:
-            # Exceeded server side rate limit
-            if response.status_code == 429:
-                retry_after: Optional[str] = response.headers.get("Retry-After", None)
-                raise RateLimitExceededException(
-                    method=method,
-                    url=url,
-                    retry_after=timedelta(seconds=float(retry_after))
-                    if retry_after is not None
-                    else None,
-                )
+        Args:
+            url: The full URL to make the request against.
+            method: The HTTP method to use (GET, POST, etc.).
 
-            # Treat all other 400-level response codes as ones that are
-            # unlikely to succeed on retry
-            cause: str = (
-                f"Unexpected response code: {response.status_code}. "
-                f"Response body: {response.text}"
-            )
-            if response.status_code >= 400 and response.status_code < 500:
-                raise NonRetryableRequestException(
+        Raises:
+            RateLimitExceededException: If the call was rejected because a
+                server side rate limit was breached and retries have been
+                exhausted.
+            NonRetryableRequestException: If the call was rejected and a retry
+                is not expected to succeed.
+            RequestException: For all other errors when making the request; it
+                is possible, though not guaranteed, that a retry could succeed.
+
+        Returns:
+            The raw response body from the request.
+        """
+        attempt: int = 0
+        while True:
+            try:
+                return await self._send_request(url, method, **kwargs)
+            except RateLimitExceededException as e:
+                if attempt >= self._max_rate_limit_retries:
+                    raise
+                wait_for: Optional[float] = self._get_rate_limit_wait_sec(e, attempt)
+                if wait_for is None:
+                    raise
+                await asyncio.sleep(wait_for)
+                attempt += 1
+
+    async def _send_request(self, url: str, method: str, **kwargs) -> bytes:
+        """
+        Helper method that makes a single attempt to run the input request
+        using the connection pool that is shared by all calls made with this
+        client.
+
+        Args:
+            url: The full URL to make the request against.
+            method: The HTTP method to use (GET, POST, etc.).
+
+        Raises:
+            RateLimitExceededException: If the call was rejected because a
+                server side rate limit was breached.
+            NonRetryableRequestException: If the call was rejected and a retry
+                is not expected to succeed.
+            RequestException: For all other errors when making the request; it
+                is possible, though not guaranteed, that a retry could succeed.
+
+        Returns:
+            The raw response body from the request.
+        """
+
+        # Make the request, waiting for other requests to finish first if
+        # too many are already running
+        try:
+            loop_state: _LoopState = await self._get_loop_state()
+            http_client: httpx.AsyncClient = loop_state.http_client
+            if (semaphore := loop_state.request_semaphore) is not None:
+                async with semaphore:
+                    response: httpx.Response = await http_client.request(
+                        method=method,
+                        url=url,
+                        **kwargs,
+                    )
+            else:
+                response = await http_client.request(
                     method=method,
                     url=url,
-                    cause=cause,
+                    **kwargs,
                 )
-
-            # Treat all other errors as ones that might succeed on retry
+        except Exception as e:
             raise RequestException(
                 method=method,
                 url=url,
-                cause=cause,
-            )
+                cause=f"Exception while making request: {type(e).__name__}: {e}",
+            ) from e
 
-        return response.text
+        # Successful responses are the common case and are returned without
+        # any other checks
+        if response.status_code < 300:
+            return response.content
+        _raise_for_status(response, method, url)
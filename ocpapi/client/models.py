@@ -1,9 +1,12 @@
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Type, TypeVar
 
+import orjson
 from dataclasses_json import CatchAll, Undefined, config, dataclass_json
 
+T = TypeVar("T", bound="_DataModel")
+
 
 @dataclass_json(undefined=Undefined.INCLUDE)
 @dataclass
@@ -18,6 +21,20 @@ class _DataModel:
     explicitly in this class.
     """
 
+    @classmethod
+    def from_bytes(cls: Type[T], data: bytes) -> T:
+        """
+        Creates an instance of this class from a UTF-8 encoded JSON document.
+        This avoids decoding the input to a str before it is parsed.
+
+        Args:
+            data: The JSON document to parse.
+
+        Returns:
+            An instance of this class with fields populated from the input.
+        """
+        return cls.from_dict(orjson.loads(data))
+
 
 @dataclass_json(undefined=Undefined.INCLUDE)
 @dataclass
@@ -1,6 +1,6 @@
 from unittest import TestCase as UnitTestCase
 
-import requests
+import httpx
 
 from ocpapi.client import get_results_ui_url
 
@@ -17,6 +17,6 @@ class TestUI(UnitTestCase):
         # Make sure the UI URL is reachable
 
         ui_url = get_results_ui_url(self.API_HOST, self.KNOWN_SYSTEM_ID)
-        response = requests.head(ui_url)
+        response = httpx.head(ui_url)
 
         self.assertEqual(200, response.status_code)
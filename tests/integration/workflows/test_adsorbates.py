@@ -2,7 +2,7 @@ import time
 from typing import List
 from unittest import IsolatedAsyncioTestCase
 
-import requests
+import httpx
 
 from ocpapi.client import AdsorbateSlabConfigs, Client, Status
 from ocpapi.workflows import (
@@ -120,5 +120,5 @@ class TestAdsorbates(IsolatedAsyncioTestCase):
                 self.assertNotEqual(forces, (0, 0, 0))
 
         # Make sure the UI URL is reachable
-        response = requests.head(results.slabs[0].ui_url)
+        response = httpx.head(results.slabs[0].ui_url)
         self.assertEqual(200, response.status_code)
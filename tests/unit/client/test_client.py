@@ -1,9 +1,16 @@
+import asyncio
+import gzip
+import json
 from dataclasses import dataclass
-from datetime import timedelta
-from typing import Any, Dict, List, Optional, Union
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Any, Callable, Dict, List, Optional, Union
 from unittest import IsolatedAsyncioTestCase
 
-import responses
+import httpx
+import numpy as np
+import respx
+import zstandard
 
 from ocpapi.client import (
     Adsorbates,
@@ -26,6 +33,7 @@ from ocpapi.client import (
     Slabs,
     Status,
 )
+from ocpapi.client.client import _json_default
 from ocpapi.client.models import _DataModel
 
 
@@ -45,7 +53,13 @@ class TestClient(IsolatedAsyncioTestCase):
         client_method_args: Optional[Dict[str, Any]] = None,
         expected_request_params: Optional[Dict[str, Any]] = None,
         expected_request_body: Optional[Dict[str, Any]] = None,
+        expected_url_query: Optional[str] = None,
     ) -> None:
+        # The full URL that is expected to be included in exceptions
+        url: str = f"https://test_host/{route}"
+        if expected_url_query:
+            url = f"{url}?{expected_url_query}"
+
         @dataclass
         class TestCase:
             message: str
@@ -58,6 +72,7 @@ class TestClient(IsolatedAsyncioTestCase):
             expected_request_params: Optional[Dict[str, Any]] = None
             expected_request_body: Optional[Dict[str, Any]] = None
             expected_exception: Optional[Exception] = None
+            redirected: bool = False
 
         test_cases: List[TestCase] = [
             # If a 429 response code is returned, then a
@@ -73,7 +88,7 @@ class TestClient(IsolatedAsyncioTestCase):
                 expected_request_body=expected_request_body,
                 expected_exception=RateLimitExceededException(
                     method=method,
-                    url=f"https://test_host/{route}",
+                    url=url,
                     retry_after=timedelta(seconds=100),
                 ),
             ),
@@ -91,7 +106,7 @@ class TestClient(IsolatedAsyncioTestCase):
                 expected_request_body=expected_request_body,
                 expected_exception=RateLimitExceededException(
                     method=method,
-                    url=f"https://test_host/{route}",
+                    url=url,
                     retry_after=None,
                 ),
             ),
@@ -108,7 +123,7 @@ class TestClient(IsolatedAsyncioTestCase):
                 expected_request_body=expected_request_body,
                 expected_exception=NonRetryableRequestException(
                     method=method,
-                    url=f"https://test_host/{route}",
+                    url=url,
                     cause=(
                         "Unexpected response code: 404. "
                         'Response body: {"message": "failed"}'
@@ -127,27 +142,27 @@ class TestClient(IsolatedAsyncioTestCase):
                 expected_request_body=expected_request_body,
                 expected_exception=RequestException(
                     method=method,
-                    url=f"https://test_host/{route}",
+                    url=url,
                     cause=(
                         "Unexpected response code: 500. "
                         'Response body: {"message": "failed"}'
                     ),
                 ),
             ),
-            # If an exception is raised from within requests, it should be
+            # If an exception is raised from within httpx, it should be
             # re-raised in the client
             TestCase(
                 message="exception in request handling",
                 scheme="https",
                 host="test_host",
-                # This tells the responses library to raise an exception
+                # This tells the respx library to raise an exception
                 response_body=Exception("exception message"),
                 response_code=successful_response_code,
                 expected_request_params=expected_request_params,
                 expected_request_body=expected_request_body,
                 expected_exception=RequestException(
                     method=method,
-                    url=f"https://test_host/{route}",
+                    url=url,
                     cause=(
                         "Exception while making request: "
                         "Exception: exception message"
@@ -166,35 +181,67 @@ class TestClient(IsolatedAsyncioTestCase):
                 expected_request_params=expected_request_params,
                 expected_request_body=expected_request_body,
             ),
+            # If the request is redirected then the redirect should be
+            # followed and the response from the new location returned
+            TestCase(
+                message="redirected response with data",
+                scheme="https",
+                host="test_host",
+                response_body=successful_response_body,
+                response_code=successful_response_code,
+                expected=successful_response_object,
+                expected_request_params=expected_request_params,
+                expected_request_body=expected_request_body,
+                redirected=True,
+            ),
         ]
 
         for case in test_cases:
             with self.subTest(msg=case.message):
-                # Match the request body if one is expected
-                match = []
+                # Match the request body and params if they are expected
+                match: Dict[str, Any] = {}
                 if case.expected_request_body is not None:
-                    match.append(
-                        responses.matchers.json_params_matcher(
-                            case.expected_request_body
-                        )
-                    )
+                    match["json"] = case.expected_request_body
                 if case.expected_request_params is not None:
-                    match.append(
-                        responses.matchers.query_param_matcher(
-                            case.expected_request_params
-                        )
-                    )
+                    match["params__eq"] = case.expected_request_params
 
                 # Mock the response to the request in the current test case
-                with responses.RequestsMock() as mock_responses:
-                    mock_responses.add(
-                        method,
-                        f"{case.scheme}://{case.host}/{route}",
-                        body=case.response_body,
-                        headers=case.response_headers,
-                        status=case.response_code,
-                        match=match,
+                with respx.mock() as mock_responses:
+                    path: str = route
+                    if case.redirected:
+                        # Redirect to the same path and query under a new
+                        # prefix, keeping the method and body
+                        mock_responses.route(
+                            method=method,
+                            url=f"{case.scheme}://{case.host}/{route}",
+                            **match,
+                        ).mock(
+                            side_effect=lambda request: httpx.Response(
+                                status_code=307,
+                                headers={
+                                    "Location": str(
+                                        request.url.copy_with(
+                                            path=f"/redirected{request.url.path}"
+                                        )
+                                    )
+                                },
+                            )
+                        )
+                        path = f"redirected/{route}"
+
+                    mocked_route = mock_responses.route(
+                        method=method,
+                        url=f"{case.scheme}://{case.host}/{path}",
+                        **match,
                     )
+                    if isinstance(case.response_body, Exception):
+                        mocked_route.side_effect = case.response_body
+                    else:
+                        mocked_route.return_value = httpx.Response(
+                            status_code=case.response_code,
+                            headers=case.response_headers,
+                            text=case.response_body,
+                        )
 
                     # Create the coroutine that will run the request
                     client = Client(scheme=case.scheme, host=case.host)
@@ -225,6 +272,346 @@ class TestClient(IsolatedAsyncioTestCase):
         client = Client(host="test-host")
         self.assertEqual("test-host", client.host)
 
+    def test_connection_pool_per_event_loop(self) -> None:
+        with respx.mock() as mock_responses:
+            mock_responses.get("https://test_host/ocp/models").respond(
+                json={"models": []},
+            )
+            client = Client(host="test_host")
+
+            # Use the client on an event loop that is then closed
+            asyncio.run(client.get_models())
+            first_http_client = client._loop_state.http_client
+            self.assertFalse(first_http_client.is_closed)
+
+            # Using the client on a new event loop should create a new http
+            # client and close the one from the closed loop
+            asyncio.run(client.get_models())
+            second_http_client = client._loop_state.http_client
+            self.assertIsNot(first_http_client, second_http_client)
+            self.assertTrue(first_http_client.is_closed)
+            self.assertFalse(second_http_client.is_closed)
+
+    def test_aclose_after_event_loop_closed(self) -> None:
+        with respx.mock() as mock_responses:
+            mock_responses.get("https://test_host/ocp/models").respond(
+                json={"models": []},
+            )
+            client = Client(host="test_host")
+
+            # Use the client on an event loop that is then closed
+            asyncio.run(client.get_models())
+            http_client = client._loop_state.http_client
+
+            # Closing the client from a new event loop should not fail
+            asyncio.run(client.aclose())
+            self.assertIsNone(client._loop_state)
+            self.assertTrue(http_client.is_closed)
+
+    async def test_connection_reuse(self) -> None:
+        with respx.mock() as mock_responses:
+            mock_responses.get("https://test_host/ocp/models").respond(
+                json={"models": []},
+            )
+
+            async with Client(host="test_host") as client:
+                # Make several requests and ensure that the same underlying
+                # http client is used for all of them
+                await client.get_models()
+                http_client = client._loop_state.http_client
+                await client.get_models()
+                self.assertIs(http_client, client._loop_state.http_client)
+
+            # The http client should be closed when exiting the context
+            self.assertIsNone(client._loop_state)
+            self.assertTrue(http_client.is_closed)
+
+    async def test_compressed_responses(self) -> None:
+        @dataclass
+        class TestCase:
+            message: str
+            content_encoding: str
+            compress: Callable[[bytes], bytes]
+
+        test_cases: List[TestCase] = [
+            TestCase(
+                message="zstd",
+                content_encoding="zstd",
+                compress=zstandard.ZstdCompressor().compress,
+            ),
+            TestCase(
+                message="gzip",
+                content_encoding="gzip",
+                compress=gzip.compress,
+            ),
+        ]
+
+        for case in test_cases:
+            with self.subTest(msg=case.message):
+                with respx.mock() as mock_responses:
+                    # Only respond if compressed responses were requested
+                    route = mock_responses.get(
+                        "https://test_host/ocp/models",
+                        headers={"Accept-Encoding": "zstd, gzip"},
+                    )
+                    route.respond(
+                        headers={"Content-Encoding": case.content_encoding},
+                        content=case.compress(b'{"models": [{"id": "model_1"}]}'),
+                    )
+
+                    client = Client(host="test_host")
+                    response = await client.get_models()
+                    self.assertEqual(response, Models(models=[Model(id="model_1")]))
+
+    async def test_retry_after_formats(self) -> None:
+        @dataclass
+        class TestCase:
+            message: str
+            retry_after: str
+            expected_min: Optional[timedelta]
+            expected_max: Optional[timedelta]
+
+        test_cases: List[TestCase] = [
+            # Number of seconds
+            TestCase(
+                message="seconds",
+                retry_after="1.5",
+                expected_min=timedelta(seconds=1.5),
+                expected_max=timedelta(seconds=1.5),
+            ),
+            # HTTP date in the future
+            TestCase(
+                message="future date",
+                retry_after=format_datetime(
+                    datetime.now(timezone.utc) + timedelta(seconds=100),
+                    usegmt=True,
+                ),
+                expected_min=timedelta(seconds=90),
+                expected_max=timedelta(seconds=100),
+            ),
+            # HTTP date in the past should not result in a wait
+            TestCase(
+                message="past date",
+                retry_after="Wed, 21 Oct 2015 07:28:00 GMT",
+                expected_min=timedelta(0),
+                expected_max=timedelta(0),
+            ),
+            # Values that cannot be parsed should be ignored
+            TestCase(
+                message="invalid value",
+                retry_after="soon",
+                expected_min=None,
+                expected_max=None,
+            ),
+            # Numbers that cannot be represented as a timedelta should be
+            # ignored
+            TestCase(
+                message="infinite value",
+                retry_after="inf",
+                expected_min=None,
+                expected_max=None,
+            ),
+            TestCase(
+                message="out of range value",
+                retry_after="1e20",
+                expected_min=None,
+                expected_max=None,
+            ),
+            TestCase(
+                message="nan value",
+                retry_after="nan",
+                expected_min=None,
+                expected_max=None,
+            ),
+        ]
+
+        for case in test_cases:
+            with self.subTest(msg=case.message):
+                with respx.mock() as mock_responses:
+                    mock_responses.get("https://test_host/ocp/models").respond(
+                        status_code=429,
+                        headers={"Retry-After": case.retry_after},
+                    )
+
+                    client = Client(host="test_host")
+                    with self.assertRaises(RateLimitExceededException) as ex:
+                        await client.get_models()
+
+                    retry_after: Optional[timedelta] = ex.exception.retry_after
+                    if case.expected_min is None:
+                        self.assertIsNone(retry_after)
+                    else:
+                        self.assertGreaterEqual(retry_after, case.expected_min)
+                        self.assertLessEqual(retry_after, case.expected_max)
+
+    async def test_rate_limit_retries(self) -> None:
+        @dataclass
+        class TestCase:
+            message: str
+            max_rate_limit_retries: int
+            responses: List[httpx.Response]
+            expected_calls: int
+            expected: Optional[Models] = None
+            expected_exception: Optional[Exception] = None
+
+        test_cases: List[TestCase] = [
+            # By default, rate limited requests should not be retried
+            TestCase(
+                message="retries disabled",
+                max_rate_limit_retries=0,
+                responses=[
+                    httpx.Response(429, headers={"Retry-After": "0"}),
+                ],
+                expected_calls=1,
+                expected_exception=RateLimitExceededException(
+                    method="GET",
+                    url="https://test_host/ocp/models",
+                    retry_after=timedelta(seconds=0),
+                ),
+            ),
+            # Rate limited requests should be retried with and without a
+            # retry-after value until one succeeds
+            TestCase(
+                message="success after retries",
+                max_rate_limit_retries=2,
+                responses=[
+                    httpx.Response(429, headers={"Retry-After": "0"}),
+                    httpx.Response(429),
+                    httpx.Response(200, json={"models": []}),
+                ],
+                expected_calls=3,
+                expected=Models(models=[]),
+            ),
+            # The last exception should be raised once retries are exhausted
+            TestCase(
+                message="retries exhausted",
+                max_rate_limit_retries=1,
+                responses=[
+                    httpx.Response(429),
+                    httpx.Response(429, headers={"Retry-After": "0"}),
+                ],
+                expected_calls=2,
+                expected_exception=RateLimitExceededException(
+                    method="GET",
+                    url="https://test_host/ocp/models",
+                    retry_after=timedelta(seconds=0),
+                ),
+            ),
+            # Retry-after values longer than the maximum wait should be
+            # raised immediately instead of retried
+            TestCase(
+                message="retry-after exceeds max wait",
+                max_rate_limit_retries=2,
+                responses=[
+                    httpx.Response(429, headers={"Retry-After": "172800"}),
+                    httpx.Response(200, json={"models": []}),
+                ],
+                expected_calls=1,
+                expected_exception=RateLimitExceededException(
+                    method="GET",
+                    url="https://test_host/ocp/models",
+                    retry_after=timedelta(days=2),
+                ),
+            ),
+            # Other errors should not be retried
+            TestCase(
+                message="non-rate-limit error",
+                max_rate_limit_retries=2,
+                responses=[
+                    httpx.Response(500, text="failed"),
+                ],
+                expected_calls=1,
+                expected_exception=RequestException(
+                    method="GET",
+                    url="https://test_host/ocp/models",
+                    cause="Unexpected response code: 500. Response body: failed",
+                ),
+            ),
+        ]
+
+        for case in test_cases:
+            with self.subTest(msg=case.message):
+                with respx.mock() as mock_responses:
+                    route = mock_responses.get("https://test_host/ocp/models")
+                    route.side_effect = case.responses
+
+                    client = Client(
+                        host="test_host",
+                        max_rate_limit_retries=case.max_rate_limit_retries,
+                        rate_limit_backoff_base_sec=0,
+                        rate_limit_max_jitter_sec=0,
+                    )
+
+                    if case.expected_exception is not None:
+                        with self.assertRaises(type(case.expected_exception)) as ex:
+                            await client.get_models()
+                        self.assertEqual(
+                            vars(case.expected_exception),
+                            vars(ex.exception),
+                        )
+                    else:
+                        response = await client.get_models()
+                        self.assertEqual(response, case.expected)
+
+                    self.assertEqual(route.call_count, case.expected_calls)
+
+    async def test_max_concurrent_requests(self) -> None:
+        in_flight: int = 0
+        max_in_flight: int = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"slabs": []})
+
+        with respx.mock() as mock_responses:
+            mock_responses.post("https://test_host/ocp/slabs").mock(side_effect=handler)
+
+            client = Client(host="test_host", max_concurrent_requests=2)
+            await asyncio.gather(*[client.get_slabs(str(i)) for i in range(6)])
+
+        self.assertEqual(max_in_flight, 2)
+
+    def test_max_concurrent_requests__invalid(self) -> None:
+        # Values below 1 would cause all requests to wait forever
+        for value in [0, -1]:
+            with self.subTest(msg=str(value)):
+                with self.assertRaises(ValueError):
+                    Client(host="test_host", max_concurrent_requests=value)
+
+    async def test_concurrent_identical_requests(self) -> None:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"models": []})
+
+        with respx.mock() as mock_responses:
+            route = mock_responses.get("https://test_host/ocp/models")
+            route.mock(side_effect=handler)
+
+            client = Client(host="test_host")
+
+            # Concurrent GET requests for the same URL should be combined
+            responses = await asyncio.gather(*[client.get_models() for _ in range(3)])
+            self.assertEqual(responses, [Models(models=[])] * 3)
+            self.assertEqual(route.call_count, 1)
+
+            # Once finished, later requests should call the API again
+            await client.get_models()
+            self.assertEqual(route.call_count, 2)
+
+            # Cancelling one caller should not affect others waiting on the
+            # same request
+            first = asyncio.ensure_future(client.get_models())
+            second = asyncio.ensure_future(client.get_models())
+            await asyncio.sleep(0)
+            first.cancel()
+            self.assertEqual(await second, Models(models=[]))
+            self.assertTrue(first.cancelled())
+            self.assertEqual(route.call_count, 3)
+
     async def test_get_models(self) -> None:
         await self._run_common_tests_against_route(
             method="GET",
@@ -305,6 +692,57 @@ class TestClient(IsolatedAsyncioTestCase):
             ),
         )
 
+    async def test_cached_routes(self) -> None:
+        @dataclass
+        class TestCase:
+            message: str
+            route: str
+            client_method_name: str
+            response_body: Dict[str, Any]
+            expected: _DataModel
+
+        test_cases: List[TestCase] = [
+            TestCase(
+                message="bulks",
+                route="ocp/bulks",
+                client_method_name="get_bulks",
+                response_body={"bulks_supported": []},
+                expected=Bulks(bulks_supported=[]),
+            ),
+            TestCase(
+                message="adsorbates",
+                route="ocp/adsorbates",
+                client_method_name="get_adsorbates",
+                response_body={"adsorbates_supported": []},
+                expected=Adsorbates(adsorbates_supported=[]),
+            ),
+        ]
+
+        for case in test_cases:
+            with self.subTest(msg=case.message):
+                with respx.mock() as mock_responses:
+                    route = mock_responses.get(f"https://test_host/{case.route}")
+                    route.respond(json=case.response_body)
+
+                    client = Client(host="test_host")
+                    request_method = getattr(client, case.client_method_name)
+
+                    # Concurrent calls should result in a single request
+                    responses = await asyncio.gather(
+                        *[request_method() for _ in range(3)]
+                    )
+                    self.assertEqual(responses, [case.expected] * 3)
+                    self.assertEqual(route.call_count, 1)
+
+                    # Later calls should use the cached response
+                    self.assertEqual(await request_method(), case.expected)
+                    self.assertEqual(route.call_count, 1)
+
+                    # After invalidating the cache, a new request should be made
+                    client.invalidate_cache()
+                    self.assertEqual(await request_method(), case.expected)
+                    self.assertEqual(route.call_count, 2)
+
     async def test_get_slabs__bulk_by_id(self) -> None:
         await self._run_common_tests_against_route(
             method="POST",
@@ -505,6 +943,76 @@ class TestClient(IsolatedAsyncioTestCase):
             ),
         )
 
+    async def test_get_adsorbate_slab_configs_many(self) -> None:
+        slabs: List[Slab] = [
+            Slab(
+                atoms=Atoms(
+                    cell=((1.1, 2.1, 3.1), (4.1, 5.1, 6.1), (7.1, 8.1, 9.1)),
+                    pbc=(True, False, True),
+                    numbers=[1],
+                    positions=[(1.1, 1.2, 1.3)],
+                    tags=[0],
+                ),
+                metadata=SlabMetadata(
+                    bulk_src_id="test_id",
+                    millers=(1, 1, 1),
+                    shift=shift,
+                    top=True,
+                ),
+            )
+            for shift in [0.1, 0.2, 0.3, 0.4, 0.5]
+        ]
+        in_flight: int = 0
+        max_in_flight: int = 0
+
+        # Echo back the slab from the request with no adsorbate configs. The
+        # first request takes longest to finish so that ordering of the
+        # results can be checked.
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            body: Dict[str, Any] = json.loads(request.content)
+            shift: float = body["slab"]["slab_metadata"]["shift"]
+            await asyncio.sleep(0.05 if shift == 0.1 else 0.01)
+            in_flight -= 1
+            return httpx.Response(
+                200,
+                json={"adsorbate_configs": [], "slab": body["slab"]},
+            )
+
+        with respx.mock() as mock_responses:
+            mock_responses.post("https://test_host/ocp/adsorbate-slab-configs").mock(
+                side_effect=handler
+            )
+
+            client = Client(host="test_host")
+            results = await client.get_adsorbate_slab_configs_many(
+                adsorbate="*A",
+                slabs=slabs,
+                concurrency=2,
+            )
+
+        self.assertEqual(
+            results,
+            [AdsorbateSlabConfigs(adsorbate_configs=[], slab=s) for s in slabs],
+        )
+        self.assertEqual(max_in_flight, 2)
+
+    async def test_get_adsorbate_slab_configs_many__invalid_concurrency(
+        self,
+    ) -> None:
+        # Values below 1 would cause all requests to wait forever
+        client = Client(host="test_host")
+        for value in [0, -1]:
+            with self.subTest(msg=str(value)):
+                with self.assertRaises(ValueError):
+                    await client.get_adsorbate_slab_configs_many(
+                        adsorbate="*A",
+                        slabs=[],
+                        concurrency=value,
+                    )
+
     async def test_submit_adsorbate_slab_relaxations(self) -> None:
         await self._run_common_tests_against_route(
             method="POST",
@@ -591,6 +1099,129 @@ class TestClient(IsolatedAsyncioTestCase):
             ),
         )
 
+    async def test_submit_adsorbate_slab_relaxations__numpy_arrays(self) -> None:
+        # Values copied from ase.Atoms objects are numpy arrays; they should be
+        # serialized the same way as lists
+        await self._run_common_tests_against_route(
+            method="POST",
+            route="ocp/adsorbate-slab-relaxations",
+            client_method_name="submit_adsorbate_slab_relaxations",
+            client_method_args={
+                "adsorbate": "*A",
+                "adsorbate_configs": [
+                    Atoms(
+                        cell=np.array([[1.1, 0, 0], [0, 2.1, 0], [0, 0, 3.1]]),
+                        pbc=np.array([True, False, True]),
+                        numbers=np.array([1]),
+                        positions=np.array([[1.1, 1.2, 1.3]]),
+                        tags=np.array([2]),
+                    ),
+                    # Arrays that orjson cannot read directly (here, not
+                    # C-contiguous and with an unsupported dtype)
+                    Atoms(
+                        cell=np.array([[1.1, 0, 0], [0, 2.1, 0], [0, 0, 3.1]]),
+                        pbc=np.array([True, False, True]),
+                        numbers=np.array([1, 8]),
+                        positions=np.array(
+                            [[1.5, 2.5, 3.5, 9.0], [4.5, 5.5, 6.5, 9.0]],
+                            dtype=np.float16,
+                        )[:, :3],
+                        tags=np.array([2, 2]),
+                    ),
+                ],
+                "bulk": Bulk(
+                    src_id="test_id",
+                    formula="AB",
+                    elements=["A", "B"],
+                ),
+                "slab": Slab(
+                    atoms=Atoms(
+                        cell=np.array([[1.1, 0, 0], [0, 2.1, 0], [0, 0, 3.1]]),
+                        pbc=np.array([True, False, True]),
+                        numbers=np.array([1, 2]),
+                        positions=np.array([[1.1, 1.2, 1.3], [2.1, 2.2, 2.3]]),
+                        tags=np.array([0, 1]),
+                    ),
+                    metadata=SlabMetadata(
+                        bulk_src_id="test_id",
+                        millers=(-1, 0, 1),
+                        shift=0.25,
+                        top=False,
+                    ),
+                ),
+                "model": "test_model",
+            },
+            expected_request_body={
+                "adsorbate": "*A",
+                "adsorbate_configs": [
+                    {
+                        "cell": [[1.1, 0.0, 0.0], [0.0, 2.1, 0.0], [0.0, 0.0, 3.1]],
+                        "pbc": [True, False, True],
+                        "numbers": [1],
+                        "positions": [[1.1, 1.2, 1.3]],
+                        "tags": [2],
+                    },
+                    {
+                        "cell": [[1.1, 0.0, 0.0], [0.0, 2.1, 0.0], [0.0, 0.0, 3.1]],
+                        "pbc": [True, False, True],
+                        "numbers": [1, 8],
+                        "positions": [[1.5, 2.5, 3.5], [4.5, 5.5, 6.5]],
+                        "tags": [2, 2],
+                    },
+                ],
+                "bulk": {
+                    "src_id": "test_id",
+                    "formula": "AB",
+                    "els": ["A", "B"],
+                },
+                "slab": {
+                    "slab_atomsobject": {
+                        "cell": [[1.1, 0.0, 0.0], [0.0, 2.1, 0.0], [0.0, 0.0, 3.1]],
+                        "pbc": [True, False, True],
+                        "numbers": [1, 2],
+                        "positions": [[1.1, 1.2, 1.3], [2.1, 2.2, 2.3]],
+                        "tags": [0, 1],
+                    },
+                    "slab_metadata": {
+                        "bulk_id": "test_id",
+                        "millers": [-1, 0, 1],
+                        "shift": 0.25,
+                        "top": False,
+                    },
+                },
+                "model": "test_model",
+                "ephemeral": False,
+            },
+            successful_response_code=200,
+            successful_response_body="""
+{
+    "system_id": "sys_id",
+    "config_ids": [1]
+}
+""",
+            successful_response_object=AdsorbateSlabRelaxationsSystem(
+                system_id="sys_id",
+                config_ids=[1],
+            ),
+        )
+
+    def test_json_default__atoms_arrays_not_copied(self) -> None:
+        # numpy arrays on Atoms objects should be handed to orjson as-is
+        # instead of being converted to lists of scalars
+        atoms = Atoms(
+            cell=np.eye(3),
+            pbc=np.array([True, True, False]),
+            numbers=np.array([1]),
+            positions=np.array([[1.1, 1.2, 1.3]]),
+            tags=np.array([2]),
+            other_fields={"extra": 1},
+        )
+        converted: Dict[str, Any] = _json_default(atoms)
+        self.assertIs(converted["cell"], atoms.cell)
+        self.assertIs(converted["positions"], atoms.positions)
+        self.assertEqual(converted["extra"], 1)
+        self.assertNotIn("other_fields", converted)
+
     async def test_get_adsorbate_slab_relaxations_request(self) -> None:
         await self._run_common_tests_against_route(
             method="GET",
@@ -682,6 +1313,7 @@ class TestClient(IsolatedAsyncioTestCase):
                 "config_id": ["1", "2"],
                 "field": ["A", "B"],
             },
+            expected_url_query="field=A&field=B&config_id=1&config_id=2",
             successful_response_code=200,
             successful_response_body="""
 {
@@ -101,6 +101,43 @@ class ModelTestWrapper:
                         actual = self._obj_type.from_json(case.json_repr)
                         self.assertEqual(actual, case.expected)
 
+        def test_from_bytes(self) -> None:
+            @dataclass
+            class TestCase:
+                message: str
+                json_repr: bytes
+                expected: Final[Optional[T]] = None
+                expected_exception: Final[Optional[Type[Exception]]] = None
+
+            test_cases: List[TestCase] = [
+                # If the json object is empty then default values should
+                # be used for all fields
+                TestCase(
+                    message="empty object",
+                    json_repr=b"{}",
+                    expected_exception=Exception,
+                ),
+                # If all fields are set then they should be included in the
+                # resulting object
+                TestCase(
+                    message="all fields set",
+                    json_repr=self._obj_json.encode(),
+                    expected=self._obj,
+                ),
+            ]
+
+            for case in test_cases:
+                with self.subTest(msg=case.message):
+                    # Make sure an exception is raised if one is expected
+                    if case.expected_exception is not None:
+                        with self.assertRaises(case.expected_exception):
+                            self._obj_type.from_bytes(case.json_repr)
+
+                    # Otherwise make sure the expected value is returned
+                    if case.expected is not None:
+                        actual = self._obj_type.from_bytes(case.json_repr)
+                        self.assertEqual(actual, case.expected)
+
         def test_to_json(self) -> None:
             @dataclass
             class TestCase: